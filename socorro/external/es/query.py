@@ -4,8 +4,6 @@
 
 import datetime
 import elasticsearch
-import json
-import re
 
 from configman import RequiredConfig, Namespace, class_converter
 
@@ -15,6 +13,12 @@ from socorro.external.es.supersearch import BAD_INDEX_REGEX
 from socorro.lib import datetimeutil, external_common
 
 
+# Elasticsearch clients shared by all Query instances for the lifetime of the
+# process, keyed on (elasticsearch_urls, timeout). The webapp creates a new
+# Query for every request, so caching on the instance wouldn't be reused.
+_connections = {}
+
+
 class Query(RequiredConfig):
     """Implement the /query service with ElasticSearch."""
 
@@ -33,11 +37,30 @@ class Query(RequiredConfig):
         self.context = self.config.elasticsearch_class(self.config)
 
     def get_connection(self):
-        with self.context(timeout=self.context.get_timeout_extended()) as conn:
-            return conn
+        """Return the Elasticsearch connection, creating it on first use.
+
+        The connection holds no per-query state, so one client is shared by
+        all Query instances with the same urls and timeout rather than
+        rebuilding it for every query.
+
+        """
+        timeout = self.context.get_timeout_extended()
+        key = (tuple(self.config.elasticsearch_urls), timeout)
+        conn = _connections.get(key)
+        if conn is None:
+            with self.context(timeout=timeout) as conn:
+                _connections[key] = conn
+        return conn
 
     def get(self, **kwargs):
-        """Return the result of a custom query"""
+        """Return the result of a custom query
+
+        If ``query`` is a list of queries, they are all sent in a single
+        multi-search request and the list of their results is returned, in the
+        same order. Errors for individual queries are reported in their result
+        rather than raised.
+
+        """
         params = external_common.parse_arguments(self.filters, kwargs)
 
         if not params.query:
@@ -66,9 +89,17 @@ class Query(RequiredConfig):
         connection = self.get_connection()
 
         try:
-            results = connection.search(body=json.dumps(params.query), **search_args)
+            if isinstance(params.query, list):
+                # Pair each query with an empty header so it uses the indices
+                # and doctype passed to msearch.
+                body = []
+                for query in params.query:
+                    body.extend(({}, query))
+                results = connection.msearch(body=body, **search_args)["responses"]
+            else:
+                results = connection.search(body=params.query, **search_args)
         except elasticsearch.exceptions.NotFoundError as e:
-            missing_index = re.findall(BAD_INDEX_REGEX, e.error)[0]
+            missing_index = BAD_INDEX_REGEX.findall(e.error)[0]
             raise ResourceNotFound(
                 "elasticsearch index '%s' does not exist" % missing_index
             )
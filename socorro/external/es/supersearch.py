@@ -441,7 +441,7 @@ class SuperSearch(RequiredConfig, SearchBase):
 
                 break  # Yay! Results!
             except NotFoundError as e:
-                missing_index = re.findall(BAD_INDEX_REGEX, e.error)[0]
+                missing_index = BAD_INDEX_REGEX.findall(e.error)[0]
                 if missing_index in indices:
                     del indices[indices.index(missing_index)]
                 else:
@@ -96,6 +96,10 @@ def parse_arguments(filters, arguments, modern=False):
                             param = [param]
                     elif t == "list" and isinstance(param, list):
                         continue
+                    elif t == "json":
+                        # A decoded JSON value can itself be a list, which
+                        # is one value rather than several to join.
+                        param = check_type(param, t)
                     elif isinstance(param, list) and "list" not in types:
                         param = " ".join(param)
                         param = check_type(param, t)
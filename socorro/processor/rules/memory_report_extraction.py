@@ -13,6 +13,51 @@ UNITS_BYTES = 0
 # For more information on those values, see:
 # https://dxr.mozilla.org/mozilla-central/source/xpcom/base/nsIMemoryReporter.idl#27-125
 
+# Metrics that are in the memory report.
+# Note: theses keys use dashes instead of underscores because that's how they
+# appear in the paths of the memory report. For the sake of consistent naming
+# in our documents, we will rewrite them before adding them to the
+# processed_crash.
+_MEASURED_KEYS = (
+    "gfx-textures",
+    "ghost-windows",
+    "heap-allocated",
+    "host-object-urls",
+    "private",
+    "resident",
+    "resident-unique",
+    "system-heap-allocated",
+    "vsize-max-contiguous",
+    "vsize",
+)
+
+# Metrics that are derived from the memory report.
+_DERIVED_KEYS = (
+    "explicit",
+    "heap-overhead",
+    "heap-unclassified",
+    "images",
+    "js-main-runtime",
+    "top-none-detached",
+)
+
+# Totals are accumulated in a list; these map each metric to its position.
+_ALL_KEYS = _MEASURED_KEYS + _DERIVED_KEYS
+_KEY_INDEX = {key: i for i, key in enumerate(_ALL_KEYS)}
+_MEASURED_INDEX = {key: _KEY_INDEX[key] for key in _MEASURED_KEYS}
+
+# Replace all dashes in keys with underscores to fit our crash documents'
+# naming conventions.
+_OUTPUT_KEYS = tuple(key.replace("-", "_") for key in _ALL_KEYS)
+
+_EXPLICIT = _KEY_INDEX["explicit"]
+_HEAP_ALLOCATED = _KEY_INDEX["heap-allocated"]
+_HEAP_OVERHEAD = _KEY_INDEX["heap-overhead"]
+_HEAP_UNCLASSIFIED = _KEY_INDEX["heap-unclassified"]
+_IMAGES = _KEY_INDEX["images"]
+_JS_MAIN_RUNTIME = _KEY_INDEX["js-main-runtime"]
+_TOP_NONE_DETACHED = _KEY_INDEX["top-none-detached"]
+
 
 class MemoryReportExtraction(Rule):
     """Extract key measurements from the memory_report object into a more
@@ -21,20 +66,20 @@ class MemoryReportExtraction(Rule):
     """
 
     def predicate(self, raw_crash, dumps, processed_crash, proc_meta):
-        try:
-            # Verify that...
-            return (
-                # ... we have a pid...
-                "pid" in processed_crash["json_dump"]
-                # ... we have a memory report...
-                and bool(processed_crash["memory_report"])
-                # ... and that memory report is recognisable.
-                and "version" in processed_crash["memory_report"]
-                and "reports" in processed_crash["memory_report"]
-                and "hasMozMallocUsableSize" in processed_crash["memory_report"]
-            )
-        except KeyError:
-            return False
+        json_dump = processed_crash.get("json_dump") or {}
+        memory_report = processed_crash.get("memory_report")
+
+        # Verify that...
+        return (
+            # ... we have a pid...
+            "pid" in json_dump
+            # ... we have a memory report...
+            and bool(memory_report)
+            # ... and that memory report is recognisable.
+            and "version" in memory_report
+            and "reports" in memory_report
+            and "hasMozMallocUsableSize" in memory_report
+        )
 
     def action(self, raw_crash, dumps, processed_crash, processor_meta):
         pid = processed_crash["json_dump"]["pid"]
@@ -57,56 +102,36 @@ class MemoryReportExtraction(Rule):
     def _get_memory_measures(self, memory_report, pid):
         explicit_heap = 0
         explicit_nonheap = 0
-        pid_found = False
         pid_str = f"(pid {pid})"
 
-        # These ones are in the memory report.
-        # Note: theses keys use dashes instead of underscores because that's
-        # how they appear in the paths of the memory report. For the sake of
-        # consistent naming in our documents, we will rewrite them before
-        # adding them to the processed_crash.
-        metrics_measured = {
-            "gfx-textures": 0,
-            "ghost-windows": 0,
-            "heap-allocated": 0,
-            "host-object-urls": 0,
-            "private": 0,
-            "resident": 0,
-            "resident-unique": 0,
-            "system-heap-allocated": 0,
-            "vsize-max-contiguous": 0,
-            "vsize": 0,
-        }
-
-        # These ones are derived from the memory report.
-        metrics_derived = {
-            "explicit": 0,
-            "heap-overhead": 0,
-            "heap-unclassified": 0,
-            "images": 0,
-            "js-main-runtime": 0,
-            "top-none-detached": 0,
-        }
-
-        all_metrics = {}
-        all_metrics.update(metrics_measured)
-        all_metrics.update(metrics_derived)
+        totals = [0] * len(_ALL_KEYS)
 
-        # Process reports
-        for report in memory_report["reports"]:
-            process = report["process"]
-
-            if pid_str not in process:
-                continue
-
-            pid_found = True
+        # Only keep the reports for the process that crashed.
+        reports = [
+            report
+            for report in memory_report["reports"]
+            if pid_str in report["process"]
+        ]
+        if not reports:
+            raise ValueError(f"no measurements found for pid {pid}")
 
+        # Process reports
+        for report in reports:
             path = report["path"]
             kind = report["kind"]
             units = report["units"]
             amount = report["amount"]
 
-            if path.startswith("explicit/"):
+            # Split the path once and classify it on its top-level segment
+            # rather than scanning it with a series of prefix tests.
+            top, sep, rest = path.partition("/")
+
+            if not sep:
+                index = _MEASURED_INDEX.get(path)
+                if index is not None:
+                    totals[index] += amount
+
+            elif top == "explicit":
                 if units != UNITS_BYTES:
                     raise ValueError(
                         "bad units for an explicit/ report: {}, {}".format(
@@ -125,31 +150,20 @@ class MemoryReportExtraction(Rule):
                         )
                     )
 
-                if path.startswith("explicit/images/"):
-                    all_metrics["images"] += amount
-                elif "top(none)/detached" in path:
-                    all_metrics["top-none-detached"] += amount
-                elif path.startswith("explicit/heap-overhead/"):
-                    all_metrics["heap-overhead"] += amount
-
-            elif path.startswith("js-main-runtime/"):
-                all_metrics["js-main-runtime"] += amount
+                section, sep, _ = rest.partition("/")
+                if sep and section == "images":
+                    totals[_IMAGES] += amount
+                elif "top(none)/detached" in rest:
+                    totals[_TOP_NONE_DETACHED] += amount
+                elif sep and section == "heap-overhead":
+                    totals[_HEAP_OVERHEAD] += amount
 
-            elif path in metrics_measured:
-                all_metrics[path] += amount
-
-        if not pid_found:
-            raise ValueError(f"no measurements found for pid {pid}")
+            elif top == "js-main-runtime":
+                totals[_JS_MAIN_RUNTIME] += amount
 
         # Nb: sometimes heap-unclassified is negative due to bogus measurements
         # of some kind. We just show the negative value anyway.
-        all_metrics["heap-unclassified"] = all_metrics["heap-allocated"] - explicit_heap
-        all_metrics["explicit"] = all_metrics["heap-allocated"] + explicit_nonheap
-
-        # Replace all dashes in keys with underscores to fit our crash
-        # documents' naming conventions.
-        memory_measures = {
-            key.replace("-", "_"): val for key, val in all_metrics.items()
-        }
+        totals[_HEAP_UNCLASSIFIED] = totals[_HEAP_ALLOCATED] - explicit_heap
+        totals[_EXPLICIT] = totals[_HEAP_ALLOCATED] + explicit_nonheap
 
-        return memory_measures
+        return dict(zip(_OUTPUT_KEYS, totals))
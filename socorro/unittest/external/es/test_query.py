@@ -9,6 +9,7 @@ import pytest
 
 from socorro.lib import DatabaseError, MissingArgumentError, ResourceNotFound
 from socorro.external.es.base import generate_list_of_indexes
+from socorro.external.es import query
 from socorro.external.es.query import Query
 from socorro.lib.datetimeutil import utc_now, date_to_string
 from socorro.unittest.external.es.base import ElasticsearchTestCase
@@ -25,9 +26,15 @@ class TestIntegrationQuery(ElasticsearchTestCase):
 
     def setup_method(self):
         super().setup_method()
+        # Don't let clients (or mocks of them) leak between tests.
+        query._connections.clear()
         config = self.get_base_config(cls=Query)
         self.api = Query(config=config)
 
+    def teardown_method(self):
+        query._connections.clear()
+        super().teardown_method()
+
     def test_get(self):
         datestamp = date_to_string(utc_now())
         self.index_crash(
@@ -65,6 +72,51 @@ class TestIntegrationQuery(ElasticsearchTestCase):
         with pytest.raises(DatabaseError):
             self.api.get(query={"query": {}})
 
+    @mock.patch("socorro.external.es.connection_context.elasticsearch")
+    def test_get_reuses_connection(self, mocked_es):
+        mocked_connection = mock.Mock()
+        mocked_es.Elasticsearch.return_value = mocked_connection
+
+        # The webapp creates a new Query for every request, so the client must
+        # be shared across instances.
+        config = self.get_base_config(cls=Query)
+        Query(config=config).get(query={"query": {}})
+        Query(config=config).get(query={"query": {}})
+        assert mocked_es.Elasticsearch.call_count == 1
+        assert mocked_connection.search.call_count == 2
+
+    @mock.patch("socorro.external.es.connection_context.elasticsearch")
+    def test_get_multiple_queries(self, mocked_es):
+        mocked_connection = mock.Mock()
+        mocked_connection.msearch.return_value = {
+            "responses": [{"hits": {"total": 1}}, {"hits": {"total": 2}}]
+        }
+        mocked_es.Elasticsearch.return_value = mocked_connection
+
+        queries = [{"query": {"match_all": {}}}, {"query": {}}]
+        res = self.api.get(query=queries, indices=["ALL"])
+        assert res == [{"hits": {"total": 1}}, {"hits": {"total": 2}}]
+        mocked_connection.msearch.assert_called_with(
+            body=[{}, {"query": {"match_all": {}}}, {}, {"query": {}}]
+        )
+        assert not mocked_connection.search.called
+
+        # Resolved indices and doctype apply to every query in the batch.
+        self.api.get(query=queries, indices=["socorro_201801", "socorro_200047"])
+        mocked_connection.msearch.assert_called_with(
+            body=[{}, {"query": {"match_all": {}}}, {}, {"query": {}}],
+            index=["socorro_201801", "socorro_200047"],
+            doc_type=self.es_context.get_doctype(),
+        )
+
+        # Errors for individual queries are returned, not raised.
+        error = {"error": "IndexMissingException[[not_an_index] missing]"}
+        mocked_connection.msearch.return_value = {
+            "responses": [{"hits": {"total": 1}}, error]
+        }
+        res = self.api.get(query=queries, indices=["not_an_index"])
+        assert res == [{"hits": {"total": 1}}, error]
+
     @mock.patch("socorro.external.es.connection_context.elasticsearch")
     def test_get_with_indices(self, mocked_es):
         mocked_connection = mock.Mock()
@@ -78,14 +130,14 @@ class TestIntegrationQuery(ElasticsearchTestCase):
             last_week, now, self.api.context.get_index_template()
         )
         mocked_connection.search.assert_called_with(
-            body='{"query": {}}',
+            body={"query": {}},
             index=indices,
             doc_type=self.es_context.get_doctype(),
         )
 
         # Test all indices.
         self.api.get(query={"query": {}}, indices=["ALL"])
-        mocked_connection.search.assert_called_with(body='{"query": {}}')
+        mocked_connection.search.assert_called_with(body={"query": {}})
 
         # Test forcing indices.
         self.api.get(
@@ -93,7 +145,7 @@ class TestIntegrationQuery(ElasticsearchTestCase):
             indices=["socorro_201801", "socorro_200047", "not_an_index"],
         )
         mocked_connection.search.assert_called_with(
-            body='{"query": {}}',
+            body={"query": {}},
             index=["socorro_201801", "socorro_200047", "not_an_index"],
             doc_type=self.es_context.get_doctype(),
         )
@@ -105,7 +157,7 @@ class TestIntegrationQuery(ElasticsearchTestCase):
 
         api.get(query={"query": {}})
         mocked_connection.search.assert_called_with(
-            body='{"query": {}}',
+            body={"query": {}},
             index=["testsocorro"],
             doc_type=api.context.get_doctype(),
         )
@@ -145,6 +145,16 @@ class TestExternalCommon:
             assert params[key] == params_exp[key]
         assert params == params_exp
 
+    def test_parse_arguments_json(self):
+        filters = [("query", None, "json")]
+
+        params = external_common.parse_arguments(filters, {"query": '[{"a": 1}]'})
+        assert params.query == [{"a": 1}]
+
+        # Already decoded lists are kept as they are, not joined.
+        params = external_common.parse_arguments(filters, {"query": [{"a": 1}, {}]})
+        assert params.query == [{"a": 1}, {}]
+
     def test_parse_arguments_with_class_validators(self):
         class NumberConverter:
             def clean(self, value):
@@ -49,6 +49,16 @@ class TestMemoryReportExtraction:
         predicate_result = rule.predicate({}, {}, processed_crash, {})
         assert not predicate_result
 
+        processed_crash = {
+            "memory_report": {
+                "reports": [],
+                "version": "",
+                "hasMozMallocUsableSize": "",
+            },
+        }
+        predicate_result = rule.predicate({}, {}, processed_crash, {})
+        assert not predicate_result
+
     def test_predicate_failure_bad_unrecognizable(self):
         rule = MemoryReportExtraction()
 